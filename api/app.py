@@ -5,73 +5,363 @@ This server acts as a bridge between the React frontend and the C backend.
 It runs the compiled vmem_shell executable with --json flag and returns results.
 """
 
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+from flask_compress import Compress
 import subprocess
-import json
+import errno
+import heapq
 import os
+import random
+import select
+import struct
+import threading
+import time
+from collections import OrderedDict, deque
+import numpy as np
+import orjson
+
+# JIT compiler for the batch simulators. It is a listed requirement; the
+# plain Python fallback only covers platforms without a numba build.
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """Stand-in decorator so the kernels still import without numba."""
+        return lambda func: func
+
+
+def json_response(obj):
+    """
+    Serialize obj with orjson straight into a JSON Response. Used directly
+    by the endpoints with large bodies, skipping jsonify's argument handling.
+    """
+    return Response(orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS), mimetype='application/json')
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson (C encoder) instead of stdlib json."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Same argument rules as jsonify(): one value, a list of values, or keywords
+        if args and kwargs:
+            raise TypeError('app.json.response() takes either args or kwargs, not both')
+        if len(args) == 1:
+            obj = args[0]
+        else:
+            obj = args or kwargs or None
+        # Hand orjson's bytes straight to the response - no str round trip
+        return json_response(obj)
+
 
 app = Flask(__name__)
+app.json = ORJSONProvider(app)  # jsonify() now serializes via orjson
 CORS(app)  # Enable CORS for React frontend
+app.config['COMPRESS_MIN_SIZE'] = 500  # Leave small TLB/paging replies as-is
+Compress(app)  # gzip large JSON bodies (processes, maps)
 
 # Path to the compiled C executable
 BACKEND_DIR = os.path.join(os.path.dirname(__file__), '..', 'backend')
 VMEM_SHELL = os.path.join(BACKEND_DIR, 'bin', 'vmem_shell')
 
+# Longest command line (newline included) the daemon's fgets buffer holds
+DAEMON_LINE_MAX = 511
+
+class TLBState:
+    """
+    TLB simulator state. Entries are stored as parallel arrays (one slot per
+    entry); a slot holds a live translation only while valid_arr[slot] is
+    True. 'index' maps each live VPN to its slot and 'lru' orders live slots
+    oldest-first for replacement (by recency, or by load order for FIFO).
+    'status_entries' caches the status view's entry list; any change to the
+    entries drops it (sets it to None) so the next status call rebuilds it.
+    """
+    
+    __slots__ = (
+        'initialized', 'size', 'policy', 'hits', 'misses', 'access_counter',
+        'clock_hand', 'index', 'lru', 'vpn_arr', 'pfn_arr', 'valid_arr',
+        'last_access_arr', 'ref_arr', 'status_entries', 'lock'
+    )
+    
+    def __init__(self):
+        self.lock = threading.Lock()  # guards every mutating TLB endpoint
+        self.reset()
+    
+    def reset(self, size=16, policy='LRU', initialized=False):
+        """Start over with an empty TLB and zeroed statistics."""
+        self.initialized = initialized
+        self.size = size
+        self.policy = policy
+        self.hits = 0
+        self.misses = 0
+        self.access_counter = 0
+        self.clock_hand = 0
+        self.clear_entries()
+    
+    def clear_entries(self):
+        """Allocate fresh, all-invalid entry storage."""
+        size = self.size
+        self.index = {}
+        self.lru = OrderedDict()
+        self.vpn_arr = np.zeros(size, dtype=np.int64)
+        self.pfn_arr = np.zeros(size, dtype=np.int64)
+        self.valid_arr = np.zeros(size, dtype=bool)
+        self.last_access_arr = np.zeros(size, dtype=np.int64)
+        self.ref_arr = np.zeros(size, dtype=bool)
+        self.status_entries = None
+
+    def flush(self):
+        """Invalidate every entry in place (stale vpn/pfn values stay masked)."""
+        self.valid_arr.fill(False)
+        self.index.clear()
+        self.lru.clear()
+        self.status_entries = None
+
+
 # TLB state (simulated in Python for API since C shell is stateless per call)
-tlb_state = {
-    'initialized': False,
-    'size': 16,
-    'policy': 'LRU',
-    'entries': [],
-    'hits': 0,
-    'misses': 0
-}
+tlb_state = TLBState()
+
+
+class PagingState:
+    """
+    Demand paging simulator state. Frames are stored as parallel arrays
+    indexed by frame number; a frame holds a page only while occupied[i]
+    is True. Replacement order lives in 'ref_bits' (CLOCK reference bits,
+    bit i = frame i), an intrusive doubly-linked recency list for LRU
+    (lru_prev/lru_next, -1 = none) and a load-order deque for FIFO.
+    'status_json' caches the serialized status body; None means stale.
+    Timestamps are int32; paging_rebase_stamps renumbers them before
+    access_counter would overflow.
+    """
+    
+    __slots__ = (
+        'initialized', 'num_frames', 'policy', 'vpn_arr', 'loaded_at_arr',
+        'last_access_arr', 'occupied', 'page_table', 'page_faults',
+        'page_hits', 'disk_reads', 'access_counter', 'access_history',
+        'clock_hand', 'ref_bits', 'frame_mask', 'lru_prev', 'lru_next', 'lru_head',
+        'lru_tail', 'fifo', 'status_json', 'lock'
+    )
+    
+    def __init__(self):
+        self.lock = threading.Lock()  # guards every paging endpoint
+        self.reset()
+    
+    def reset(self, num_frames=4, policy='LRU', initialized=False):
+        """Start over with all frames empty and zeroed statistics."""
+        self.initialized = initialized
+        self.num_frames = num_frames
+        self.policy = policy
+        self.vpn_arr = np.full(num_frames, -1, dtype=np.int64)
+        self.loaded_at_arr = np.zeros(num_frames, dtype=np.int32)
+        self.last_access_arr = np.zeros(num_frames, dtype=np.int32)
+        self.occupied = np.zeros(num_frames, dtype=bool)
+        self.page_table = {}  # VPN -> frame_index mapping
+        self.page_faults = 0
+        self.page_hits = 0
+        self.disk_reads = 0
+        self.access_counter = 0
+        self.access_history = deque(maxlen=50)  # Recent accesses for visualization
+        self.clock_hand = 0
+        self.ref_bits = 0
+        self.frame_mask = (1 << num_frames) - 1  # one ref bit per frame
+        self.lru_prev = [-1] * num_frames
+        self.lru_next = [-1] * num_frames
+        self.lru_head = -1  # Least recently used frame
+        self.lru_tail = -1  # Most recently used frame
+        self.fifo = deque()
+        self.status_json = None
+
 
 # Demand Paging simulation state
-paging_state = {
-    'initialized': False,
-    'num_frames': 4,           # Number of physical memory frames
-    'policy': 'LRU',           # Replacement policy
-    'frames': [],              # List of frames: [{'vpn': x, 'loaded_at': t, 'last_access': t}, ...]
-    'page_table': {},          # VPN -> frame_index mapping
-    'page_faults': 0,
-    'page_hits': 0,
-    'disk_reads': 0,
-    'access_counter': 0,
-    'access_history': [],      # Recent accesses for visualization
-    'clock_hand': 0            # For Clock algorithm
-}
+paging_state = PagingState()
 
+# Largest timestamp the int32 frame arrays can hold
+PAGING_STAMP_LIMIT = np.iinfo(np.int32).max
 
-def run_vmem_command(*args):
+# Shared by the RANDOM replacement policies (TLB and paging)
+sim_rng = random.Random()
+
+
+class VmemDaemon:
     """
-    Run the vmem_shell with --json flag and parse the result.
+    Long-lived `vmem_shell --daemon` child process.
+
+    Commands are written one per line on stdin; each reply is a 4-byte
+    big-endian length followed by that many bytes of JSON. The child is
+    started on first use and restarted if it dies or a request fails.
+    """
+
+    def __init__(self, cmd):
+        self.cmd = cmd
+        self.proc = None
+        self.lock = threading.Lock()  # one request in flight at a time
+
+    def request(self, *args, timeout=30):
+        """Send one command and return its raw JSON reply."""
+        with self.lock:
+            if self.proc is None or self.proc.poll() is not None:
+                self.proc = subprocess.Popen(
+                    self.cmd,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    bufsize=0
+                )
+            try:
+                self.proc.stdin.write((' '.join(args) + '\n').encode())
+                deadline = time.monotonic() + timeout
+                (length,) = struct.unpack('>I', self._read_exact(4, deadline, timeout))
+                return self._read_exact(length, deadline, timeout)
+            except BaseException:
+                # Framing is unknown after a failure - start over next time
+                self.stop()
+                raise
+
+    def _read_exact(self, n, deadline, timeout):
+        fd = self.proc.stdout.fileno()
+        data = b''
+        while len(data) < n:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                raise subprocess.TimeoutExpired(self.cmd, timeout)
+            chunk = os.read(fd, n - len(data))
+            if not chunk:
+                raise EOFError('vmem_shell daemon exited')
+            data += chunk
+        return data
+
+    def stop(self):
+        """Stop the child (it exits on its own once stdin is closed)."""
+        if self.proc is None:
+            return
+        try:
+            self.proc.stdin.close()
+            self.proc.wait(timeout=1)
+        except Exception:
+            self.proc.kill()
+        self.proc = None
+
+
+vmem_daemon = VmemDaemon([VMEM_SHELL, '--daemon'])
+
+
+def run_vmem_command_raw(*args):
     """
+    Run a vmem_shell command and return its raw JSON output.
+
+    Uses the persistent daemon, falling back to a one-shot `--json` run if
+    the daemon cannot be used.
+    Returns (True, stdout_bytes) on success, (False, error_dict) on failure.
+    """
+    # Whitespace would split an argument (or a command) on the daemon's stdin
+    if any(not arg or any(c.isspace() for c in arg) for arg in args):
+        return False, {'success': False, 'error': 'Invalid argument'}
+    if len(' '.join(args).encode()) + 1 > DAEMON_LINE_MAX:
+        return False, {'success': False, 'error': 'Command too long'}
+    
     try:
-        cmd = ['sudo', VMEM_SHELL, '--json'] + list(args)
+        return True, vmem_daemon.request(*args)
+    except subprocess.TimeoutExpired:
+        return False, {'success': False, 'error': 'Command timed out'}
+    except (OSError, EOFError):
+        pass  # Daemon unavailable - fall back to a one-shot run
+    
+    try:
+        cmd = [VMEM_SHELL, '--json'] + list(args)
         result = subprocess.run(
             cmd,
             capture_output=True,
             timeout=30
         )
         
-        # Decode with error replacement for non-UTF-8 bytes
-        stdout = result.stdout.decode('utf-8', errors='replace')
-        stderr = result.stderr.decode('utf-8', errors='replace')
-        
         if result.returncode != 0:
-            return {'success': False, 'error': stderr or 'Command failed'}
+            # Decode with error replacement for non-UTF-8 bytes
+            stderr = result.stderr.decode('utf-8', errors='replace')
+            return False, {'success': False, 'error': stderr or 'Command failed'}
         
-        return json.loads(stdout)
+        return True, result.stdout
     except subprocess.TimeoutExpired:
-        return {'success': False, 'error': 'Command timed out'}
-    except json.JSONDecodeError as e:
-        return {'success': False, 'error': f'Invalid JSON response from backend: {str(e)}'}
+        return False, {'success': False, 'error': 'Command timed out'}
     except FileNotFoundError:
-        return {'success': False, 'error': f'Backend not found at {VMEM_SHELL}. Please compile first.'}
+        return False, {'success': False, 'error': f'Backend not found at {VMEM_SHELL}. Please compile first.'}
     except Exception as e:
-        return {'success': False, 'error': str(e)}
+        return False, {'success': False, 'error': str(e)}
+
+
+def run_vmem_command(*args):
+    """
+    Run the vmem_shell with --json flag and parse the result.
+    """
+    ok, payload = run_vmem_command_raw(*args)
+    if not ok:
+        return payload
+    return parse_vmem_output(payload)
+
+
+def parse_vmem_output(payload):
+    """Parse raw vmem_shell JSON output into a dict."""
+    try:
+        # Parse the frame bytes directly - no str decode on the common path
+        return orjson.loads(payload)
+    except orjson.JSONDecodeError:
+        pass  # Most likely non-UTF-8 bytes (e.g. in a process name)
+    
+    try:
+        # Decode with error replacement for non-UTF-8 bytes
+        return orjson.loads(payload.decode('utf-8', errors='replace'))
+    except orjson.JSONDecodeError as e:
+        return {'success': False, 'error': f'Invalid JSON response from backend: {str(e)}'}
+
+
+# Process list cache - dashboards poll it every second or two
+PROCESS_CACHE_TTL = 0.5  # seconds
+process_cache = {'ts': 0.0, 'raw': None, 'by_pid': None}
+process_cache_lock = threading.Lock()
+
+
+def cached_processes(parse=False):
+    """
+    Return (ok, payload) for the 'processes' command, reusing the last
+    result for PROCESS_CACHE_TTL seconds. The payload is the raw JSON bytes,
+    or a {pid: process} dict when parse=True.
+    """
+    with process_cache_lock:
+        if process_cache['raw'] is None or time.monotonic() - process_cache['ts'] >= PROCESS_CACHE_TTL:
+            ok, payload = run_vmem_command_raw('processes')
+            if not ok:
+                return False, payload
+            process_cache.update(ts=time.monotonic(), raw=payload, by_pid=None)
+        
+        if not parse:
+            return True, process_cache['raw']
+        
+        if process_cache['by_pid'] is None:
+            result = parse_vmem_output(process_cache['raw'])
+            if not result.get('success'):
+                return False, result
+            process_cache['by_pid'] = {proc['pid']: proc for proc in result.get('data', [])}
+        return True, process_cache['by_pid']
+
+
+def vmem_passthrough(*args):
+    """
+    Run the vmem_shell and return its JSON output to the client as-is,
+    without parsing and re-encoding it.
+    """
+    ok, payload = run_vmem_command_raw(*args)
+    if not ok:
+        return jsonify(payload)
+    return Response(payload, mimetype='application/json')
 
 
 # =============================================================================
@@ -81,19 +371,22 @@ def run_vmem_command(*args):
 @app.route('/api/processes', methods=['GET'])
 def get_processes():
     """Get list of all running processes."""
-    return jsonify(run_vmem_command('processes'))
+    ok, payload = cached_processes()
+    if not ok:
+        return jsonify(payload)
+    return Response(payload, mimetype='application/json')
 
 
 @app.route('/api/process/<int:pid>', methods=['GET'])
 def get_process(pid):
     """Get information about a specific process."""
-    result = run_vmem_command('processes')
-    if not result.get('success'):
-        return jsonify(result)
+    ok, by_pid = cached_processes(parse=True)
+    if not ok:
+        return jsonify(by_pid)
     
-    for proc in result.get('data', []):
-        if proc['pid'] == pid:
-            return jsonify({'success': True, 'data': proc})
+    proc = by_pid.get(pid)
+    if proc is not None:
+        return jsonify({'success': True, 'data': proc})
     
     return jsonify({'success': False, 'error': f'Process {pid} not found'})
 
@@ -105,52 +398,262 @@ def get_process(pid):
 @app.route('/api/process/<int:pid>/maps', methods=['GET'])
 def get_memory_maps(pid):
     """Get memory regions for a process."""
-    return jsonify(run_vmem_command('maps', str(pid)))
+    return vmem_passthrough('maps', str(pid))
 
 
 @app.route('/api/process/<int:pid>/translate/<address>', methods=['GET'])
 def translate_address(pid, address):
     """Translate virtual address to physical address."""
-    return jsonify(run_vmem_command('translate', str(pid), address))
+    return vmem_passthrough('translate', str(pid), address)
 
 
 @app.route('/api/process/<int:pid>/stats', methods=['GET'])
 def get_memory_stats(pid):
     """Get memory statistics for a process."""
-    return jsonify(run_vmem_command('stats', str(pid)))
+    return vmem_passthrough('stats', str(pid))
 
 
 @app.route('/api/system/memory', methods=['GET'])
 def get_system_memory():
     """Get system-wide memory information."""
-    return jsonify(run_vmem_command('sysinfo'))
+    return vmem_passthrough('sysinfo')
 
 
 # =============================================================================
 # TLB Simulation Endpoints (Stateful - maintained in Python)
 # =============================================================================
 
+# VPNs/PFNs live in int64 simulator arrays (and orjson encodes at most 64 bits)
+ADDR_LIMIT = 1 << 63
+
+
+def to_int(value, base=0):
+    """
+    Coerce a VPN/PFN to int. Ints pass straight through and other numbers
+    are truncated; strings are parsed with their prefix deciding the base
+    ('42', '0x2a', '0o52') unless an explicit base is given. Unprefixed
+    strings are decimal, leading zeros included ('010' is 10). Raises
+    ValueError or TypeError for anything else, including values outside
+    0 <= v < ADDR_LIMIT.
+    """
+    if type(value) is int:
+        result = value
+    elif not isinstance(value, str):
+        result = int(value)
+    else:
+        try:
+            result = int(value, base)
+        except ValueError:
+            if base != 0:
+                raise
+            result = int(value, 10)  # base 0 rejects leading zeros
+    if not 0 <= result < ADDR_LIMIT:
+        raise ValueError(f'{value!r} out of range')
+    return result
+
+
+def request_base(data):
+    """Return the optional 'base' hint for string VPNs, or None if invalid."""
+    base = data.get('base', 0)
+    if type(base) is not int or not (base == 0 or 2 <= base <= 36):
+        return None
+    return base
+
+
+def tlb_place(slot, vpn, pfn):
+    """Write a translation into a slot, keeping the VPN index in sync."""
+    old_vpn = int(tlb_state.vpn_arr[slot]) if tlb_state.valid_arr[slot] else None
+    # Arrays first: they are the only step that can fail (out-of-range ints)
+    tlb_state.vpn_arr[slot] = vpn
+    tlb_state.pfn_arr[slot] = pfn
+    tlb_state.valid_arr[slot] = True
+    index = tlb_state.index
+    if old_vpn is not None:
+        index.pop(old_vpn, None)
+    index[vpn] = slot
+    lru = tlb_state.lru
+    lru[slot] = None
+    lru.move_to_end(slot)
+    tlb_state.status_entries = None
+
+
+# Policy codes understood by the JIT kernel (anything else behaves as LRU)
+TLB_POLICY_CODES = {'LRU': 0, 'FIFO': 1, 'RANDOM': 2, 'CLOCK': 3}
+TLB_HIT_TEMPLATE = {'hit': True, 'pfn': 0, 'vpn': 0}  # copied per hit
+
+
+@njit(cache=True)
+def clock_sweep(ref_arr, hand):
+    """
+    Second-chance sweep for the batch kernels: starting at hand, clear set
+    reference bits until a clear one is found. Returns (victim, new_hand).
+    A clear bit turns up within one lap; the 2x cap only guards against a
+    corrupt bitmap hanging the request, falling back to the hand.
+    """
+    size = len(ref_arr)
+    for _ in range(2 * size):
+        if not ref_arr[hand]:
+            return hand, (hand + 1) % size
+        ref_arr[hand] = False
+        hand = (hand + 1) % size
+    return hand, (hand + 1) % size
+
+
+@njit(cache=True)
+def tlb_simulate_batch(vpns, pfns, has_pfn, vpn_arr, pfn_arr, valid_arr,
+                       last_access_arr, order_arr, ref_arr, policy_code,
+                       clock_hand, counter, stamp, hits_out, pfn_out):
+    """
+    Run a batch of TLB accesses in place on the entry arrays - the same
+    lookup/evict/insert steps as tlb_access_one, compiled by numba.
+    order_arr ranks live slots for replacement (lowest is evicted first).
+    Returns (hits, clock_hand, counter).
+    """
+    size = vpn_arr.shape[0]
+    hits = 0
+    for i in range(vpns.shape[0]):
+        vpn = vpns[i]
+        
+        slot = -1
+        for j in range(size):
+            if valid_arr[j] and vpn_arr[j] == vpn:
+                slot = j
+                break
+        
+        if slot >= 0:
+            # Hit
+            hits += 1
+            hits_out[i] = True
+            pfn_out[i] = pfn_arr[slot]
+            if policy_code != 1:  # FIFO keeps load order on hit
+                order_arr[slot] = stamp
+                stamp += 1
+            last_access_arr[slot] = counter
+            counter += 1
+            continue
+        
+        # Miss - insert if PFN provided
+        if not has_pfn[i]:
+            continue
+        
+        for j in range(size):
+            if not valid_arr[j]:
+                slot = j
+                break
+        
+        if slot < 0:
+            if policy_code == 2:
+                slot = np.random.randint(0, size)
+            elif policy_code == 3:
+                slot, clock_hand = clock_sweep(ref_arr, clock_hand)
+            else:
+                slot = 0
+                for j in range(1, size):
+                    if order_arr[j] < order_arr[slot]:
+                        slot = j
+        
+        vpn_arr[slot] = vpn
+        pfn_arr[slot] = pfns[i]
+        valid_arr[slot] = True
+        order_arr[slot] = stamp
+        stamp += 1
+        last_access_arr[slot] = counter
+        ref_arr[slot] = True
+        counter += 1
+    
+    return hits, clock_hand, counter
+
+
+def tlb_access_batch_jit(accesses):
+    """
+    Run parsed (vpn, pfn) accesses through tlb_simulate_batch, then rebuild
+    the VPN index and replacement order from the updated arrays.
+    """
+    n = len(accesses)
+    vpns = np.array([vpn for vpn, _ in accesses], dtype=np.int64)
+    pfns = np.array([0 if pfn is None else pfn for _, pfn in accesses], dtype=np.int64)
+    has_pfn = np.array([pfn is not None for _, pfn in accesses], dtype=bool)
+    hits_out = np.zeros(n, dtype=bool)
+    pfn_out = np.zeros(n, dtype=np.int64)
+    
+    order = np.zeros(tlb_state.size, dtype=np.int64)
+    for rank, slot in enumerate(tlb_state.lru):
+        order[slot] = rank
+    
+    hits, clock_hand, counter = tlb_simulate_batch(
+        vpns, pfns, has_pfn,
+        tlb_state.vpn_arr, tlb_state.pfn_arr, tlb_state.valid_arr,
+        tlb_state.last_access_arr, order, tlb_state.ref_arr,
+        TLB_POLICY_CODES.get(tlb_state.policy, 0),
+        tlb_state.clock_hand, tlb_state.access_counter,
+        len(tlb_state.lru), hits_out, pfn_out
+    )
+    
+    tlb_state.hits += hits
+    tlb_state.misses += n - hits
+    tlb_state.clock_hand = clock_hand
+    tlb_state.access_counter = counter
+    
+    live = np.flatnonzero(tlb_state.valid_arr)
+    tlb_state.index = dict(zip(tlb_state.vpn_arr[live].tolist(), live.tolist()))
+    tlb_state.lru = OrderedDict.fromkeys(live[np.argsort(order[live], kind='stable')].tolist())
+    tlb_state.status_entries = None
+    
+    return [
+        {'hit': True, 'pfn': pfn, 'vpn': vpn} if hit else
+        {'hit': False, 'vpn': vpn, 'inserted': inserted}
+        for vpn, hit, pfn, inserted in zip(
+            vpns.tolist(), hits_out.tolist(), pfn_out.tolist(), has_pfn.tolist()
+        )
+    ]
+
+
+def tlb_free_slot():
+    """Return the first invalid slot, or None if the TLB is full."""
+    valid = tlb_state.valid_arr
+    slot = int(valid.argmin())  # first False, in one vectorized pass
+    return None if valid[slot] else slot
+
+
+def tlb_clock_victim():
+    """
+    Clock (second chance) victim selection as vectorized ops: starting at
+    the hand, take the first slot whose reference bit is clear, clearing
+    the bits of every slot passed over on the way.
+    """
+    size = tlb_state.size
+    hand = tlb_state.clock_hand
+    reference_bit = tlb_state.ref_arr
+    
+    sweep = (np.arange(size) + hand) % size  # slots in clock order
+    clear = np.flatnonzero(~reference_bit[sweep])
+    steps = int(clear[0]) if clear.size else size  # all set: full lap
+    
+    reference_bit[sweep[:steps]] = False
+    victim = int(sweep[steps % size])
+    tlb_state.clock_hand = (victim + 1) % size
+    return victim
+
+
+def tlb_evict_oldest():
+    """Pop and return the slot at the head of the replacement order."""
+    slot, _ = tlb_state.lru.popitem(last=False)
+    return slot
+
+
 @app.route('/api/tlb/init', methods=['POST'])
 def init_tlb():
     """Initialize TLB simulator."""
-    global tlb_state
-    
     data = request.get_json() or {}
     size = data.get('size', 16)
     policy = data.get('policy', 'LRU')
     
-    if size < 1 or size > 256:
+    # Checked before reset(), which rebuilds the live state field by field
+    if type(size) is not int or size < 1 or size > 256:
         return jsonify({'success': False, 'error': 'Size must be between 1 and 256'})
     
-    tlb_state = {
-        'initialized': True,
-        'size': size,
-        'policy': policy,
-        'entries': [None] * size,
-        'hits': 0,
-        'misses': 0,
-        'access_counter': 0
-    }
+    with tlb_state.lock:
+        tlb_state.reset(size, policy, initialized=True)
     
     return jsonify({'success': True, 'message': f'TLB initialized with {size} entries'})
 
@@ -158,9 +661,7 @@ def init_tlb():
 @app.route('/api/tlb/lookup', methods=['POST'])
 def tlb_lookup():
     """Lookup address in TLB."""
-    global tlb_state
-    
-    if not tlb_state['initialized']:
+    if not tlb_state.initialized:
         return jsonify({'success': False, 'error': 'TLB not initialized'})
     
     data = request.get_json() or {}
@@ -169,33 +670,27 @@ def tlb_lookup():
     if vpn is None:
         return jsonify({'success': False, 'error': 'VPN required'})
     
-    # Convert to int if string
-    if isinstance(vpn, str):
-        vpn = int(vpn, 16) if vpn.startswith('0x') else int(vpn)
-    
-    # Look for entry
-    for entry in tlb_state['entries']:
-        if entry is not None and entry['vpn'] == vpn and entry['valid']:
-            tlb_state['hits'] += 1
-            entry['last_access'] = tlb_state['access_counter']
-            tlb_state['access_counter'] += 1
-            return jsonify({
-                'success': True,
-                'hit': True,
-                'pfn': entry['pfn'],
-                'vpn': vpn
-            })
-    
-    tlb_state['misses'] += 1
+    try:
+        vpn = to_int(vpn)
+    except (ValueError, TypeError):
+        return jsonify({'success': False, 'error': 'Invalid VPN'})
+    
+    with tlb_state.lock:
+        # Look for entry
+        slot = tlb_state.index.get(vpn)
+        if slot is not None:
+            result = tlb_hit(slot, vpn)
+            result['success'] = True
+            return jsonify(result)
+        
+        tlb_state.misses += 1
     return jsonify({'success': True, 'hit': False, 'vpn': vpn})
 
 
 @app.route('/api/tlb/insert', methods=['POST'])
 def tlb_insert():
     """Insert entry into TLB."""
-    global tlb_state
-    
-    if not tlb_state['initialized']:
+    if not tlb_state.initialized:
         return jsonify({'success': False, 'error': 'TLB not initialized'})
     
     data = request.get_json() or {}
@@ -205,190 +700,212 @@ def tlb_insert():
     if vpn is None or pfn is None:
         return jsonify({'success': False, 'error': 'VPN and PFN required'})
     
-    # Convert to int if string
-    if isinstance(vpn, str):
-        vpn = int(vpn, 16) if vpn.startswith('0x') else int(vpn)
-    if isinstance(pfn, str):
-        pfn = int(pfn, 16) if pfn.startswith('0x') else int(pfn)
-    
-    # Find empty slot or victim
-    empty_slot = None
-    for i, entry in enumerate(tlb_state['entries']):
-        if entry is None or not entry['valid']:
-            empty_slot = i
-            break
-    
-    if empty_slot is None:
-        # Apply replacement policy (LRU)
-        min_access = float('inf')
-        victim = 0
-        for i, entry in enumerate(tlb_state['entries']):
-            if entry and entry['last_access'] < min_access:
-                min_access = entry['last_access']
-                victim = i
-        empty_slot = victim
-    
-    tlb_state['entries'][empty_slot] = {
-        'vpn': vpn,
-        'pfn': pfn,
-        'valid': True,
-        'last_access': tlb_state['access_counter']
-    }
-    tlb_state['access_counter'] += 1
+    try:
+        vpn = to_int(vpn)
+        pfn = to_int(pfn)
+    except (ValueError, TypeError):
+        return jsonify({'success': False, 'error': 'Invalid VPN or PFN'})
+    
+    with tlb_state.lock:
+        # Reuse the VPN's slot if already cached, else find empty slot or victim
+        empty_slot = tlb_state.index.get(vpn)
+        if empty_slot is None:
+            empty_slot = tlb_free_slot()
+            if empty_slot is None:
+                # Evict the oldest entry (LRU order, or load order under FIFO)
+                empty_slot = tlb_evict_oldest()
+        
+        tlb_place(empty_slot, vpn, pfn)
+        tlb_state.last_access_arr[empty_slot] = tlb_state.access_counter
+        tlb_state.ref_arr[empty_slot] = False
+        tlb_state.access_counter += 1
     
     return jsonify({'success': True, 'message': 'Entry inserted', 'slot': empty_slot})
 
 
-@app.route('/api/tlb/access', methods=['POST'])
-def tlb_access():
-    """Access address (lookup + insert on miss)."""
-    global tlb_state
-    
-    if not tlb_state['initialized']:
-        return jsonify({'success': False, 'error': 'TLB not initialized'})
+def tlb_hit(slot, vpn):
+    """Record a hit on a live slot and return its result dict."""
+    tlb_state.hits += 1
+    if tlb_state.policy != 'FIFO':
+        tlb_state.lru.move_to_end(slot)
+    tlb_state.last_access_arr[slot] = tlb_state.access_counter
+    tlb_state.access_counter += 1
+    tlb_state.status_entries = None
     
-    data = request.get_json() or {}
-    vpn = data.get('vpn')
-    pfn = data.get('pfn')  # PFN to insert on miss
-    
-    if vpn is None:
-        return jsonify({'success': False, 'error': 'VPN required'})
-    
-    # First try lookup
-    if isinstance(vpn, str):
-        vpn = int(vpn, 16) if vpn.startswith('0x') else int(vpn)
-    
-    for entry in tlb_state['entries']:
-        if entry is not None and entry['vpn'] == vpn and entry['valid']:
-            tlb_state['hits'] += 1
-            entry['last_access'] = tlb_state['access_counter']
-            tlb_state['access_counter'] += 1
-            return jsonify({
-                'success': True,
-                'hit': True,
-                'pfn': entry['pfn'],
-                'vpn': vpn
-            })
+    result = TLB_HIT_TEMPLATE.copy()
+    result['pfn'] = int(tlb_state.pfn_arr[slot])
+    result['vpn'] = vpn
+    return result
+
+
+def tlb_access_one(vpn, pfn=None):
+    """
+    Access one VPN: lookup, and on a miss insert (vpn -> pfn) if a PFN is
+    given. Shared by the single and batch access endpoints.
+    """
+    slot = tlb_state.index.get(vpn)
+    if slot is not None:
+        return tlb_hit(slot, vpn)
     
     # Miss - insert if PFN provided
-    tlb_state['misses'] += 1
+    tlb_state.misses += 1
     
     if pfn is not None:
-        if isinstance(pfn, str):
-            pfn = int(pfn, 16) if pfn.startswith('0x') else int(pfn)
-        
         # Find empty slot first
-        empty_slot = None
-        for i, entry in enumerate(tlb_state['entries']):
-            if entry is None or not entry['valid']:
-                empty_slot = i
-                break
+        empty_slot = tlb_free_slot()
         
         if empty_slot is None:
             # Apply replacement policy based on selected algorithm
-            policy = tlb_state.get('policy', 'LRU')
+            policy = tlb_state.policy
             
             if policy == 'LRU':
-                # Least Recently Used - evict entry with oldest last_access
-                min_access = float('inf')
-                victim = 0
-                for i, entry in enumerate(tlb_state['entries']):
-                    if entry and entry['last_access'] < min_access:
-                        min_access = entry['last_access']
-                        victim = i
-                empty_slot = victim
+                # Least Recently Used - evict head of the recency order
+                empty_slot = tlb_evict_oldest()
                 
             elif policy == 'FIFO':
-                # First In First Out - evict entry with oldest insert_time
-                min_insert = float('inf')
-                victim = 0
-                for i, entry in enumerate(tlb_state['entries']):
-                    if entry and entry.get('insert_time', 0) < min_insert:
-                        min_insert = entry.get('insert_time', 0)
-                        victim = i
-                empty_slot = victim
+                # First In First Out - evict head of the load order
+                empty_slot = tlb_evict_oldest()
                 
             elif policy == 'RANDOM':
                 # Random replacement
-                import random
-                empty_slot = random.randint(0, tlb_state['size'] - 1)
+                empty_slot = sim_rng.randrange(tlb_state.size)
                 
             elif policy == 'CLOCK':
                 # Clock (Second Chance) algorithm
-                clock_hand = tlb_state.get('clock_hand', 0)
-                while True:
-                    entry = tlb_state['entries'][clock_hand]
-                    if entry and not entry.get('reference_bit', False):
-                        empty_slot = clock_hand
-                        tlb_state['clock_hand'] = (clock_hand + 1) % tlb_state['size']
-                        break
-                    if entry:
-                        entry['reference_bit'] = False
-                    clock_hand = (clock_hand + 1) % tlb_state['size']
+                empty_slot = tlb_clock_victim()
                 
             else:
                 # Default to LRU
-                min_access = float('inf')
-                victim = 0
-                for i, entry in enumerate(tlb_state['entries']):
-                    if entry and entry['last_access'] < min_access:
-                        min_access = entry['last_access']
-                        victim = i
-                empty_slot = victim
+                empty_slot = tlb_evict_oldest()
         
-        tlb_state['entries'][empty_slot] = {
-            'vpn': vpn,
-            'pfn': pfn,
-            'valid': True,
-            'last_access': tlb_state['access_counter'],
-            'insert_time': tlb_state['access_counter'],
-            'reference_bit': True
-        }
-        tlb_state['access_counter'] += 1
+        tlb_place(empty_slot, vpn, pfn)
+        tlb_state.last_access_arr[empty_slot] = tlb_state.access_counter
+        tlb_state.ref_arr[empty_slot] = True
+        tlb_state.access_counter += 1
     
-    return jsonify({
-        'success': True,
+    return {
         'hit': False,
         'vpn': vpn,
         'inserted': pfn is not None
+    }
+
+
+@app.route('/api/tlb/access', methods=['POST'])
+def tlb_access():
+    """Access address (lookup + insert on miss)."""
+    if not tlb_state.initialized:
+        return jsonify({'success': False, 'error': 'TLB not initialized'})
+    
+    data = request.get_json() or {}
+    vpn = data.get('vpn')
+    pfn = data.get('pfn')  # PFN to insert on miss
+    
+    if vpn is None:
+        return jsonify({'success': False, 'error': 'VPN required'})
+    
+    try:
+        vpn = to_int(vpn)
+        if pfn is not None:
+            pfn = to_int(pfn)
+    except (ValueError, TypeError):
+        return jsonify({'success': False, 'error': 'Invalid VPN or PFN'})
+    
+    with tlb_state.lock:
+        result = tlb_access_one(vpn, pfn)
+    
+    return jsonify({'success': True, **result})
+
+
+@app.route('/api/tlb/access_batch', methods=['POST'])
+def tlb_access_batch():
+    """Run a list of TLB accesses in one request."""
+    if not tlb_state.initialized:
+        return jsonify({'success': False, 'error': 'TLB not initialized'})
+    
+    data = request.get_json() or {}
+    accesses = data.get('accesses', [])
+    
+    if not accesses or not isinstance(accesses, list):
+        return jsonify({'success': False, 'error': 'Accesses list required'})
+    
+    # Parse everything up front so a bad entry doesn't leave a half-run batch
+    parsed = []
+    for access in accesses:
+        if not isinstance(access, dict):
+            return jsonify({'success': False, 'error': 'Each access must be an object with a vpn'})
+        vpn = access.get('vpn')
+        pfn = access.get('pfn')
+        if vpn is None:
+            return jsonify({'success': False, 'error': 'VPN required'})
+        try:
+            parsed.append((to_int(vpn), None if pfn is None else to_int(pfn)))
+        except (ValueError, TypeError):
+            return jsonify({'success': False, 'error': 'Invalid VPN or PFN'})
+    
+    with tlb_state.lock:
+        if NUMBA_AVAILABLE:
+            results = tlb_access_batch_jit(parsed)
+        else:
+            access_one = tlb_access_one
+            results = [access_one(vpn, pfn) for vpn, pfn in parsed]
+        hits, misses = tlb_state.hits, tlb_state.misses
+    
+    total = hits + misses
+    hit_rate = (hits / total * 100) if total > 0 else 0
+    
+    return json_response({
+        'success': True,
+        'results': results,
+        'stats': {
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': round(hit_rate, 2)
+        }
     })
 
 
 @app.route('/api/tlb/status', methods=['GET'])
 def tlb_status():
     """Get TLB status and statistics."""
-    if not tlb_state['initialized']:
+    if not tlb_state.initialized:
         return jsonify({'success': False, 'error': 'TLB not initialized'})
     
-    total = tlb_state['hits'] + tlb_state['misses']
-    hit_rate = (tlb_state['hits'] / total * 100) if total > 0 else 0
-    
-    entries = []
-    for i, entry in enumerate(tlb_state['entries']):
-        if entry is not None:
-            entries.append({
-                'index': i,
-                'vpn': hex(entry['vpn']),
-                'pfn': hex(entry['pfn']),
-                'valid': entry['valid'],
-                'last_access': entry['last_access']
-            })
-        else:
-            entries.append({
-                'index': i,
-                'vpn': None,
-                'pfn': None,
-                'valid': False,
-                'last_access': 0
-            })
-    
-    return jsonify({
+    total = tlb_state.hits + tlb_state.misses
+    hit_rate = (tlb_state.hits / total * 100) if total > 0 else 0
+    
+    # Rebuild the entry list only if something changed since the last poll
+    with tlb_state.lock:
+        entries = tlb_state.status_entries
+        if entries is None:
+            entries = tlb_state.status_entries = [
+                {
+                    'index': i,
+                    'vpn': vpn,
+                    'pfn': pfn,
+                    'valid': True,
+                    'last_access': last_access
+                } if valid else {
+                    'index': i,
+                    'vpn': None,
+                    'pfn': None,
+                    'valid': False,
+                    'last_access': 0
+                }
+                for i, (vpn, pfn, valid, last_access) in enumerate(zip(
+                    tlb_state.vpn_arr.tolist(),
+                    tlb_state.pfn_arr.tolist(),
+                    tlb_state.valid_arr.tolist(),
+                    tlb_state.last_access_arr.tolist()
+                ))
+            ]
+    
+    return json_response({
         'success': True,
         'data': {
-            'size': tlb_state['size'],
-            'policy': tlb_state['policy'],
-            'hits': tlb_state['hits'],
-            'misses': tlb_state['misses'],
+            'size': tlb_state.size,
+            'policy': tlb_state.policy,
+            'hits': tlb_state.hits,
+            'misses': tlb_state.misses,
             'hit_rate': round(hit_rate, 2),
             'entries': entries
         }
@@ -398,12 +915,11 @@ def tlb_status():
 @app.route('/api/tlb/flush', methods=['POST'])
 def tlb_flush():
     """Flush TLB."""
-    global tlb_state
-    
-    if not tlb_state['initialized']:
+    if not tlb_state.initialized:
         return jsonify({'success': False, 'error': 'TLB not initialized'})
     
-    tlb_state['entries'] = [None] * tlb_state['size']
+    with tlb_state.lock:
+        tlb_state.flush()
     
     return jsonify({'success': True, 'message': 'TLB flushed'})
 
@@ -411,13 +927,12 @@ def tlb_flush():
 @app.route('/api/tlb/reset', methods=['POST'])
 def tlb_reset():
     """Reset TLB statistics."""
-    global tlb_state
-    
-    if not tlb_state['initialized']:
+    if not tlb_state.initialized:
         return jsonify({'success': False, 'error': 'TLB not initialized'})
     
-    tlb_state['hits'] = 0
-    tlb_state['misses'] = 0
+    with tlb_state.lock:
+        tlb_state.hits = 0
+        tlb_state.misses = 0
     
     return jsonify({'success': True, 'message': 'Statistics reset'})
 
@@ -426,34 +941,347 @@ def tlb_reset():
 # Demand Paging Simulation Endpoints
 # =============================================================================
 
+def paging_lru_unlink(frame_idx):
+    """Remove a frame from the LRU recency list."""
+    state = paging_state
+    prev = state.lru_prev
+    nxt = state.lru_next
+    p, n = prev[frame_idx], nxt[frame_idx]
+    if p == -1:
+        state.lru_head = n
+    else:
+        nxt[p] = n
+    if n == -1:
+        state.lru_tail = p
+    else:
+        prev[n] = p
+
+
+def paging_lru_append(frame_idx):
+    """Add a frame at the most recently used end of the LRU list."""
+    state = paging_state
+    tail = state.lru_tail
+    nxt = state.lru_next
+    state.lru_prev[frame_idx] = tail
+    nxt[frame_idx] = -1
+    if tail == -1:
+        state.lru_head = frame_idx
+    else:
+        nxt[tail] = frame_idx
+    state.lru_tail = frame_idx
+
+
+def paging_lru_rebuild(order):
+    """Relink the LRU list from frame indices ordered oldest-first."""
+    num_frames = paging_state.num_frames
+    prev = [-1] * num_frames
+    nxt = [-1] * num_frames
+    for a, b in zip(order, order[1:]):
+        nxt[a] = b
+        prev[b] = a
+    paging_state.lru_prev = prev
+    paging_state.lru_next = nxt
+    paging_state.lru_head = order[0] if order else -1
+    paging_state.lru_tail = order[-1] if order else -1
+
+
+def paging_touch(frame_idx):
+    """Record a hit: set the frame's reference bit and, under LRU, make it MRU."""
+    state = paging_state
+    state.ref_bits |= 1 << frame_idx
+    if state.policy == 'LRU' and state.lru_tail != frame_idx:
+        paging_lru_unlink(frame_idx)
+        paging_lru_append(frame_idx)
+
+
+def paging_free_frame():
+    """Return the first empty frame, or None if every frame is occupied."""
+    occupied = paging_state.occupied
+    if occupied.all():
+        return None
+    return int(occupied.argmin())
+
+
+def paging_loaded(frame_idx, vpn):
+    """Load a VPN into a frame and record it in the replacement state."""
+    state = paging_state
+    counter = state.access_counter
+    state.vpn_arr[frame_idx] = vpn
+    state.loaded_at_arr[frame_idx] = counter
+    state.last_access_arr[frame_idx] = counter
+    state.occupied[frame_idx] = True
+    state.page_table[vpn] = frame_idx
+    state.ref_bits |= 1 << frame_idx
+    policy = state.policy
+    if policy == 'LRU':
+        paging_lru_append(frame_idx)
+    elif policy == 'FIFO':
+        state.fifo.append(frame_idx)
+
+
+def paging_evict_oldest():
+    """Pop the LRU/FIFO victim: the head of the recency or load order."""
+    if paging_state.policy == 'FIFO':
+        return paging_state.fifo.popleft()
+    frame_idx = paging_state.lru_head
+    paging_lru_unlink(frame_idx)
+    return frame_idx
+
+
+def paging_clock_victim():
+    """
+    Second-chance sweep done on the reference bitmap: rotate it so the
+    hand is bit 0, take the first clear bit, and clear the set bits the
+    hand passed over. If every bit is set, a full sweep clears them all
+    and the frame under the hand is chosen.
+    """
+    state = paging_state
+    n = state.num_frames
+    hand = state.clock_hand
+    mask = state.frame_mask
+    bits = state.ref_bits
+    
+    rot = ((bits >> hand) | (bits << (n - hand))) & mask
+    clear = ~rot & mask
+    if clear:
+        skipped = (clear & -clear) - 1  # set bits below the first clear one
+        victim = (hand + skipped.bit_length()) % n
+        bits &= ~(((skipped << hand) | (skipped >> (n - hand))) & mask)
+    else:
+        victim = hand
+        bits = 0
+    
+    state.ref_bits = bits
+    state.clock_hand = (victim + 1) % n
+    return victim
+
+
+def paging_rebase_stamps():
+    """
+    Renumber the resident frames' timestamps to their ranks (0, 1, ...)
+    so access_counter restarts just above them. Only relative order
+    matters to LRU and FIFO, and ranking keeps it exactly.
+    """
+    state = paging_state
+    live = np.flatnonzero(state.occupied)
+    stamps = np.concatenate((state.loaded_at_arr[live], state.last_access_arr[live]))
+    distinct, ranks = np.unique(stamps, return_inverse=True)
+    state.loaded_at_arr[:] = 0
+    state.last_access_arr[:] = 0
+    state.loaded_at_arr[live] = ranks[:len(live)]
+    state.last_access_arr[live] = ranks[len(live):]
+    state.access_counter = len(distinct)
+    state.status_json = None
+
+
+def paging_access_one(vpn):
+    """
+    Access one page: a hit, or a page fault that loads it into a free frame
+    (evicting a victim by the current policy when memory is full). Shared
+    by the single access and sequence endpoints. Records the access in the
+    history and returns (history_entry, evicted_vpn or None).
+    """
+    # Checked before any state changes: a VPN the int64 frame arrays can't
+    # hold must not leave a victim half-evicted
+    if not 0 <= vpn < ADDR_LIMIT:
+        raise ValueError(f'VPN {vpn} out of range')
+    state = paging_state
+    if state.access_counter >= PAGING_STAMP_LIMIT:
+        paging_rebase_stamps()
+    frame_idx = state.page_table.get(vpn)
+    evicted = None
+    evicted_hex = None
+    
+    if frame_idx is not None:
+        # PAGE HIT
+        hit = True
+        state.page_hits += 1
+        state.last_access_arr[frame_idx] = state.access_counter
+        paging_touch(frame_idx)
+    else:
+        # PAGE FAULT
+        hit = False
+        state.page_faults += 1
+        state.disk_reads += 1
+        
+        # Find a free frame or evict one
+        frame_idx = paging_free_frame()
+        if frame_idx is None:
+            policy = state.policy
+            if policy == 'LRU' or policy == 'FIFO':
+                # Least recently used / oldest loaded page heads its list
+                frame_idx = paging_evict_oldest()
+            elif policy == 'RANDOM':
+                frame_idx = sim_rng.randrange(state.num_frames)
+            else:
+                # Clock (Second Chance) algorithm
+                frame_idx = paging_clock_victim()
+            
+            # Record evicted page and remove it from the page table
+            evicted = int(state.vpn_arr[frame_idx])
+            evicted_hex = hex(evicted)
+            state.page_table.pop(evicted, None)
+        
+        # Load new page into frame
+        paging_loaded(frame_idx, vpn)
+    
+    # Record access history (the deque keeps the last 50)
+    entry = {
+        'vpn': vpn,
+        'vpn_hex': hex(vpn),
+        'hit': hit,
+        'frame': frame_idx,
+        'evicted': evicted_hex
+    }
+    state.access_history.append(entry)
+    state.access_counter += 1
+    state.status_json = None
+    return entry, evicted
+
+
+# Policy codes understood by the paging JIT kernel (anything else behaves as LRU)
+PAGING_POLICY_CODES = {'LRU': 0, 'FIFO': 1, 'RANDOM': 2, 'CLOCK': 3}
+
+
+@njit(cache=True)
+def paging_simulate_batch(vpns, vpn_arr, loaded_at_arr, last_access_arr,
+                          occupied, ref_arr, policy_code, clock_hand, counter,
+                          hits_out, frame_out, evicted_out, evicted_mask):
+    """
+    Run a sequence of page accesses in place on the frame arrays - the same
+    hit/fault/evict steps as paging_sequence, compiled by numba. With at
+    most 64 frames the page table lookup is a plain scan of vpn_arr.
+    evicted_mask marks the accesses that evicted evicted_out's VPN.
+    Returns (hits, clock_hand, counter).
+    """
+    n = vpn_arr.shape[0]
+    hits = 0
+    for i in range(vpns.shape[0]):
+        vpn = vpns[i]
+        frame = -1
+        for j in range(n):
+            if occupied[j] and vpn_arr[j] == vpn:
+                frame = j
+                break
+        
+        if frame >= 0:
+            hits += 1
+            last_access_arr[frame] = counter
+            ref_arr[frame] = True
+            hits_out[i] = True
+            frame_out[i] = frame
+            counter += 1
+            continue
+        
+        for j in range(n):
+            if not occupied[j]:
+                frame = j
+                break
+        
+        if frame < 0:
+            if policy_code == 2:
+                frame = np.random.randint(0, n)
+            elif policy_code == 3:
+                frame, clock_hand = clock_sweep(ref_arr, clock_hand)
+            elif policy_code == 1:
+                frame = np.argmin(loaded_at_arr)
+            else:
+                frame = np.argmin(last_access_arr)
+            evicted_out[i] = vpn_arr[frame]
+            evicted_mask[i] = True
+        
+        vpn_arr[frame] = vpn
+        loaded_at_arr[frame] = counter
+        last_access_arr[frame] = counter
+        occupied[frame] = True
+        ref_arr[frame] = True
+        frame_out[i] = frame
+        counter += 1
+    
+    return hits, clock_hand, counter
+
+
+def paging_sequence_jit(vpns):
+    """
+    Run parsed VPNs through paging_simulate_batch, then rebuild the page
+    table, reference bitmap and LRU/FIFO order from the updated arrays.
+    Returns (results, history) where history holds the last 50 entries.
+    """
+    num_frames = paging_state.num_frames
+    n = len(vpns)
+    if paging_state.access_counter + n > PAGING_STAMP_LIMIT:
+        paging_rebase_stamps()
+    vpns = np.array(vpns, dtype=np.int64)
+    hits_out = np.zeros(n, dtype=bool)
+    frame_out = np.zeros(n, dtype=np.int64)
+    evicted_out = np.zeros(n, dtype=np.int64)
+    evicted_mask = np.zeros(n, dtype=bool)
+    bits = paging_state.ref_bits
+    ref_arr = np.array([(bits >> i) & 1 for i in range(num_frames)], dtype=bool)
+    
+    hits, clock_hand, counter = paging_simulate_batch(
+        vpns, paging_state.vpn_arr, paging_state.loaded_at_arr,
+        paging_state.last_access_arr, paging_state.occupied, ref_arr,
+        PAGING_POLICY_CODES.get(paging_state.policy, 0),
+        paging_state.clock_hand, paging_state.access_counter,
+        hits_out, frame_out, evicted_out, evicted_mask
+    )
+    
+    paging_state.page_hits += hits
+    paging_state.page_faults += n - hits
+    paging_state.disk_reads += n - hits
+    paging_state.clock_hand = clock_hand
+    paging_state.access_counter = counter
+    paging_state.ref_bits = sum(1 << i for i in np.flatnonzero(ref_arr).tolist())
+    
+    live = np.flatnonzero(paging_state.occupied)
+    paging_state.page_table = dict(zip(paging_state.vpn_arr[live].tolist(), live.tolist()))
+    policy = paging_state.policy
+    if policy == 'LRU':
+        order = live[np.argsort(paging_state.last_access_arr[live])].tolist()
+        paging_lru_rebuild(order)
+    elif policy == 'FIFO':
+        order = live[np.argsort(paging_state.loaded_at_arr[live])].tolist()
+        paging_state.fifo = deque(order)
+    
+    vpns = vpns.tolist()
+    results = [
+        {'vpn': hex(vpn), 'hit': hit, 'frame': frame_idx, 'evicted': hex(evicted) if was_evicted else None}
+        for vpn, hit, frame_idx, evicted, was_evicted in zip(
+            vpns, hits_out.tolist(), frame_out.tolist(), evicted_out.tolist(), evicted_mask.tolist()
+        )
+    ]
+    # Only the tail can survive in the 50-entry history
+    history = [
+        {
+            'vpn': vpn,
+            'vpn_hex': result['vpn'],
+            'hit': result['hit'],
+            'frame': result['frame'],
+            'evicted': result['evicted']
+        }
+        for vpn, result in zip(vpns[-50:], results[-50:])
+    ]
+    
+    return results, history
+
+
 @app.route('/api/paging/init', methods=['POST'])
 def init_paging():
     """Initialize demand paging simulator."""
-    global paging_state
-    
     data = request.get_json() or {}
     num_frames = data.get('frames', 4)
     policy = data.get('policy', 'LRU')
     
-    if num_frames < 1 or num_frames > 64:
+    # Checked before reset(), which rebuilds the live state field by field
+    if type(num_frames) is not int or num_frames < 1 or num_frames > 64:
         return jsonify({'success': False, 'error': 'Frames must be between 1 and 64'})
     
     if policy not in ['LRU', 'FIFO', 'RANDOM', 'CLOCK']:
         return jsonify({'success': False, 'error': 'Invalid policy. Use: LRU, FIFO, RANDOM, CLOCK'})
     
-    paging_state = {
-        'initialized': True,
-        'num_frames': num_frames,
-        'policy': policy,
-        'frames': [None] * num_frames,  # Each frame: None or {'vpn': x, 'loaded_at': t, 'last_access': t, 'reference_bit': True}
-        'page_table': {},  # VPN -> frame_index
-        'page_faults': 0,
-        'page_hits': 0,
-        'disk_reads': 0,
-        'access_counter': 0,
-        'access_history': [],
-        'clock_hand': 0
-    }
+    with paging_state.lock:
+        paging_state.reset(num_frames, policy, initialized=True)
     
     return jsonify({
         'success': True, 
@@ -464,10 +1292,7 @@ def init_paging():
 @app.route('/api/paging/access', methods=['POST'])
 def paging_access():
     """Access a page (may trigger page fault)."""
-    global paging_state
-    import random
-    
-    if not paging_state['initialized']:
+    if not paging_state.initialized:
         return jsonify({'success': False, 'error': 'Paging not initialized'})
     
     data = request.get_json() or {}
@@ -476,112 +1301,29 @@ def paging_access():
     if vpn is None:
         return jsonify({'success': False, 'error': 'VPN required'})
     
+    base = request_base(data)
+    if base is None:
+        return jsonify({'success': False, 'error': 'Base must be 0 or 2-36'})
+    
     # Convert string VPN to int
-    if isinstance(vpn, str):
-        vpn = int(vpn, 16) if vpn.startswith('0x') else int(vpn)
+    try:
+        vpn = to_int(vpn, base)
+    except (ValueError, TypeError):
+        return jsonify({'success': False, 'error': 'Invalid VPN'})
+    
+    with paging_state.lock:
+        entry, evicted = paging_access_one(vpn)
     
     result = {
         'vpn': vpn,
-        'vpn_hex': hex(vpn),
-        'page_fault': False,
-        'evicted_vpn': None,
-        'frame_index': None
+        'vpn_hex': entry['vpn_hex'],
+        'page_fault': not entry['hit'],
+        'evicted_vpn': evicted,
+        'frame_index': entry['frame'],
+        'hit': entry['hit']
     }
-    
-    # Check if page is already in memory
-    if vpn in paging_state['page_table']:
-        # PAGE HIT
-        frame_idx = paging_state['page_table'][vpn]
-        paging_state['page_hits'] += 1
-        paging_state['frames'][frame_idx]['last_access'] = paging_state['access_counter']
-        paging_state['frames'][frame_idx]['reference_bit'] = True
-        result['hit'] = True
-        result['frame_index'] = frame_idx
-    else:
-        # PAGE FAULT
-        paging_state['page_faults'] += 1
-        paging_state['disk_reads'] += 1
-        result['page_fault'] = True
-        result['hit'] = False
-        
-        # Find a free frame or evict one
-        free_frame = None
-        for i, frame in enumerate(paging_state['frames']):
-            if frame is None:
-                free_frame = i
-                break
-        
-        if free_frame is not None:
-            # Use free frame
-            frame_idx = free_frame
-        else:
-            # Need to evict - apply replacement policy
-            policy = paging_state['policy']
-            
-            if policy == 'LRU':
-                # Find least recently used
-                min_access = float('inf')
-                victim = 0
-                for i, frame in enumerate(paging_state['frames']):
-                    if frame['last_access'] < min_access:
-                        min_access = frame['last_access']
-                        victim = i
-                frame_idx = victim
-                
-            elif policy == 'FIFO':
-                # Find oldest loaded page
-                min_loaded = float('inf')
-                victim = 0
-                for i, frame in enumerate(paging_state['frames']):
-                    if frame['loaded_at'] < min_loaded:
-                        min_loaded = frame['loaded_at']
-                        victim = i
-                frame_idx = victim
-                
-            elif policy == 'RANDOM':
-                frame_idx = random.randint(0, paging_state['num_frames'] - 1)
-                
-            elif policy == 'CLOCK':
-                # Clock (Second Chance) algorithm
-                while True:
-                    frame = paging_state['frames'][paging_state['clock_hand']]
-                    if not frame['reference_bit']:
-                        frame_idx = paging_state['clock_hand']
-                        paging_state['clock_hand'] = (paging_state['clock_hand'] + 1) % paging_state['num_frames']
-                        break
-                    # Give second chance
-                    frame['reference_bit'] = False
-                    paging_state['clock_hand'] = (paging_state['clock_hand'] + 1) % paging_state['num_frames']
-            
-            # Record evicted page
-            evicted = paging_state['frames'][frame_idx]
-            result['evicted_vpn'] = evicted['vpn']
-            result['evicted_vpn_hex'] = hex(evicted['vpn'])
-            # Remove from page table
-            del paging_state['page_table'][evicted['vpn']]
-        
-        # Load new page into frame
-        paging_state['frames'][frame_idx] = {
-            'vpn': vpn,
-            'loaded_at': paging_state['access_counter'],
-            'last_access': paging_state['access_counter'],
-            'reference_bit': True
-        }
-        paging_state['page_table'][vpn] = frame_idx
-        result['frame_index'] = frame_idx
-    
-    # Record access history (keep last 50)
-    paging_state['access_history'].append({
-        'vpn': vpn,
-        'vpn_hex': hex(vpn),
-        'hit': result['hit'],
-        'frame': result['frame_index'],
-        'evicted': result.get('evicted_vpn_hex')
-    })
-    if len(paging_state['access_history']) > 50:
-        paging_state['access_history'] = paging_state['access_history'][-50:]
-    
-    paging_state['access_counter'] += 1
+    if evicted is not None:
+        result['evicted_vpn_hex'] = entry['evicted']
     
     return jsonify({'success': True, **result})
 
@@ -589,61 +1331,62 @@ def paging_access():
 @app.route('/api/paging/status', methods=['GET'])
 def paging_status():
     """Get paging simulator status."""
-    if not paging_state['initialized']:
+    if not paging_state.initialized:
         return jsonify({'success': False, 'error': 'Paging not initialized'})
     
-    total = paging_state['page_hits'] + paging_state['page_faults']
-    hit_rate = (paging_state['page_hits'] / total * 100) if total > 0 else 0
-    
-    # Format frames for display
-    frames = []
-    for i, frame in enumerate(paging_state['frames']):
-        if frame is not None:
-            frames.append({
-                'index': i,
-                'vpn': frame['vpn'],
-                'vpn_hex': hex(frame['vpn']),
-                'loaded_at': frame['loaded_at'],
-                'last_access': frame['last_access'],
-                'occupied': True
-            })
-        else:
-            frames.append({
-                'index': i,
-                'vpn': None,
-                'vpn_hex': None,
-                'loaded_at': None,
-                'last_access': None,
-                'occupied': False
+    # Build and store under the lock so a concurrent access can't have its
+    # invalidation overwritten by a body built from the old state
+    with paging_state.lock:
+        # Nothing changed since the last poll - resend the same body
+        body = paging_state.status_json
+        if body is None:
+            total = paging_state.page_hits + paging_state.page_faults
+            hit_rate = (paging_state.page_hits / total * 100) if total > 0 else 0
+            
+            # Format frames for display in one pass over the frame arrays
+            frames = [
+                {'index': i, 'vpn': vpn, 'vpn_hex': hex(vpn), 'loaded_at': loaded_at,
+                 'last_access': last_access, 'occupied': True}
+                if occupied else
+                {'index': i, 'vpn': None, 'vpn_hex': None, 'loaded_at': None,
+                 'last_access': None, 'occupied': False}
+                for i, (vpn, loaded_at, last_access, occupied) in enumerate(zip(
+                    paging_state.vpn_arr.tolist(),
+                    paging_state.loaded_at_arr.tolist(),
+                    paging_state.last_access_arr.tolist(),
+                    paging_state.occupied.tolist()
+                ))
+            ]
+            
+            body = paging_state.status_json = orjson.dumps({
+                'success': True,
+                'data': {
+                    'num_frames': paging_state.num_frames,
+                    'policy': paging_state.policy,
+                    'frames': frames,
+                    'page_faults': paging_state.page_faults,
+                    'page_hits': paging_state.page_hits,
+                    'hit_rate': round(hit_rate, 2),
+                    'disk_reads': paging_state.disk_reads,
+                    'access_history': list(paging_state.access_history)[-20:]  # Last 20 accesses
+                }
             })
     
-    return jsonify({
-        'success': True,
-        'data': {
-            'num_frames': paging_state['num_frames'],
-            'policy': paging_state['policy'],
-            'frames': frames,
-            'page_faults': paging_state['page_faults'],
-            'page_hits': paging_state['page_hits'],
-            'hit_rate': round(hit_rate, 2),
-            'disk_reads': paging_state['disk_reads'],
-            'access_history': paging_state['access_history'][-20:]  # Last 20 accesses
-        }
-    })
+    return Response(body, mimetype='application/json')
 
 
 @app.route('/api/paging/reset', methods=['POST'])
 def paging_reset():
     """Reset paging statistics (keep frames)."""
-    global paging_state
-    
-    if not paging_state['initialized']:
+    if not paging_state.initialized:
         return jsonify({'success': False, 'error': 'Paging not initialized'})
     
-    paging_state['page_faults'] = 0
-    paging_state['page_hits'] = 0
-    paging_state['disk_reads'] = 0
-    paging_state['access_history'] = []
+    with paging_state.lock:
+        paging_state.page_faults = 0
+        paging_state.page_hits = 0
+        paging_state.disk_reads = 0
+        paging_state.access_history.clear()
+        paging_state.status_json = None
     
     return jsonify({'success': True, 'message': 'Statistics reset'})
 
@@ -651,10 +1394,7 @@ def paging_reset():
 @app.route('/api/paging/sequence', methods=['POST'])
 def paging_sequence():
     """Run a sequence of page accesses."""
-    global paging_state
-    import random
-    
-    if not paging_state['initialized']:
+    if not paging_state.initialized:
         return jsonify({'success': False, 'error': 'Paging not initialized'})
     
     data = request.get_json() or {}
@@ -663,93 +1403,45 @@ def paging_sequence():
     if not addresses:
         return jsonify({'success': False, 'error': 'Addresses list required'})
     
-    results = []
-    for addr in addresses:
-        # Parse address
-        if isinstance(addr, str):
-            vpn = int(addr, 16) if addr.startswith('0x') else int(addr)
-        else:
-            vpn = int(addr)
-        
-        # Simulate access (reuse logic from paging_access)
-        hit = vpn in paging_state['page_table']
-        evicted = None  # Initialize evicted for access_history tracking
-        
-        if hit:
-            frame_idx = paging_state['page_table'][vpn]
-            paging_state['page_hits'] += 1
-            paging_state['frames'][frame_idx]['last_access'] = paging_state['access_counter']
-            paging_state['frames'][frame_idx]['reference_bit'] = True
-            results.append({'vpn': hex(vpn), 'hit': True, 'frame': frame_idx, 'evicted': None})
+    base = request_base(data)
+    if base is None:
+        return jsonify({'success': False, 'error': 'Base must be 0 or 2-36'})
+    
+    # Parse everything up front so a bad address doesn't leave a half-run sequence
+    try:
+        vpns = [to_int(addr, base) for addr in addresses]
+    except (ValueError, TypeError):
+        return jsonify({'success': False, 'error': 'Invalid VPN'})
+    
+    with paging_state.lock:
+        if NUMBA_AVAILABLE:
+            results, history = paging_sequence_jit(vpns)
+            paging_state.access_history.extend(history)
+            paging_state.status_json = None
         else:
-            paging_state['page_faults'] += 1
-            paging_state['disk_reads'] += 1
-            
-            # Find free or evict
-            free_frame = None
-            for i, frame in enumerate(paging_state['frames']):
-                if frame is None:
-                    free_frame = i
-                    break
-            
-            evicted = None
-            if free_frame is not None:
-                frame_idx = free_frame
-            else:
-                policy = paging_state['policy']
-                if policy == 'LRU':
-                    victim = min(range(len(paging_state['frames'])), 
-                                key=lambda i: paging_state['frames'][i]['last_access'])
-                elif policy == 'FIFO':
-                    victim = min(range(len(paging_state['frames'])), 
-                                key=lambda i: paging_state['frames'][i]['loaded_at'])
-                elif policy == 'RANDOM':
-                    victim = random.randint(0, paging_state['num_frames'] - 1)
-                else:  # CLOCK
-                    while True:
-                        frame = paging_state['frames'][paging_state['clock_hand']]
-                        if not frame['reference_bit']:
-                            victim = paging_state['clock_hand']
-                            paging_state['clock_hand'] = (paging_state['clock_hand'] + 1) % paging_state['num_frames']
-                            break
-                        frame['reference_bit'] = False
-                        paging_state['clock_hand'] = (paging_state['clock_hand'] + 1) % paging_state['num_frames']
-                
-                frame_idx = victim
-                evicted = paging_state['frames'][frame_idx]['vpn']
-                del paging_state['page_table'][evicted]
-            
-            paging_state['frames'][frame_idx] = {
-                'vpn': vpn,
-                'loaded_at': paging_state['access_counter'],
-                'last_access': paging_state['access_counter'],
-                'reference_bit': True
-            }
-            paging_state['page_table'][vpn] = frame_idx
-            results.append({'vpn': hex(vpn), 'hit': False, 'frame': frame_idx, 'evicted': hex(evicted) if evicted else None})
-        
-        # Record access history (keep last 50)
-        paging_state['access_history'].append({
-            'vpn': vpn,
-            'vpn_hex': hex(vpn),
-            'hit': hit,
-            'frame': frame_idx,
-            'evicted': hex(evicted) if evicted else None
-        })
-        if len(paging_state['access_history']) > 50:
-            paging_state['access_history'] = paging_state['access_history'][-50:]
+            access_one = paging_access_one
+            results = []
+            for vpn in vpns:
+                entry, _ = access_one(vpn)
+                results.append({
+                    'vpn': entry['vpn_hex'],
+                    'hit': entry['hit'],
+                    'frame': entry['frame'],
+                    'evicted': entry['evicted']
+                })
         
-        paging_state['access_counter'] += 1
+        page_faults = paging_state.page_faults
+        page_hits = paging_state.page_hits
     
-    total = paging_state['page_hits'] + paging_state['page_faults']
-    hit_rate = (paging_state['page_hits'] / total * 100) if total > 0 else 0
+    total = page_hits + page_faults
+    hit_rate = (page_hits / total * 100) if total > 0 else 0
     
-    return jsonify({
+    return json_response({
         'success': True,
         'results': results,
         'stats': {
-            'page_faults': paging_state['page_faults'],
-            'page_hits': paging_state['page_hits'],
+            'page_faults': page_faults,
+            'page_hits': page_hits,
             'hit_rate': round(hit_rate, 2)
         }
     })
@@ -773,32 +1465,13 @@ def health_check():
 @app.route('/api/reset-all', methods=['POST'])
 def reset_all():
     """Reset all simulators (TLB and Paging) to initial state."""
-    global tlb_state, paging_state
-    
     # Reset TLB
-    tlb_state = {
-        'initialized': False,
-        'size': 16,
-        'policy': 'LRU',
-        'entries': [],
-        'hits': 0,
-        'misses': 0
-    }
+    with tlb_state.lock:
+        tlb_state.reset()
     
     # Reset Paging
-    paging_state = {
-        'initialized': False,
-        'num_frames': 4,
-        'policy': 'LRU',
-        'frames': [],
-        'page_table': {},
-        'page_faults': 0,
-        'page_hits': 0,
-        'disk_reads': 0,
-        'access_counter': 0,
-        'access_history': [],
-        'clock_hand': 0
-    }
+    with paging_state.lock:
+        paging_state.reset()
     
     return jsonify({
         'success': True,
@@ -812,21 +1485,67 @@ def reset_all():
 import mmap
 import ctypes
 
+class PlaygroundState:
+    """Memory playground state - tracks the live allocated regions."""
+    
+    __slots__ = ('allocations', 'next_id', 'free_ids', 'total_allocated', 'total_locked')
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        """Forget every region (callers release the mappings first)."""
+        self.allocations = {}     # region_id -> region, live regions only
+        self.next_id = 0          # Next never-used region ID
+        self.free_ids = []        # Heap of IDs released by free, reused lowest-first
+        self.total_allocated = 0  # Total bytes allocated
+        self.total_locked = 0     # Total bytes locked
+
+
 # Playground state - tracks allocated memory regions
-playground_state = {
-    'allocations': [],      # List of allocated regions
-    'total_allocated': 0,   # Total bytes allocated
-    'total_locked': 0,      # Total bytes locked
-    'page_faults_start': 0, # Page faults when started
-}
+playground_state = PlaygroundState()
 
 # Load libc for mlock/munlock/madvise
 try:
     libc = ctypes.CDLL('libc.so.6', use_errno=True)
+    # Declare signatures once: calls then take plain ints with no per-call
+    # type inference or c_void_p/c_size_t boxing
+    for func in (libc.mlock, libc.munlock):
+        func.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
+        func.restype = ctypes.c_int
     MLOCK_AVAILABLE = True
 except:
     MLOCK_AVAILABLE = False
 
+MADV_POPULATE_WRITE = 23  # Linux 5.14+: fault in writable pages in bulk
+MADV_HUGEPAGE = 14        # Ask for transparent huge pages
+MAP_HUGETLB = 0x40000     # Back the mapping with reserved hugetlbfs pages
+HUGE_PAGE_SIZE = 2 * 1024 * 1024
+
+
+def playground_populate(mm, size_bytes, page_size=4096):
+    """
+    Fault in every page of a region. The kernel does it in one call with
+    MADV_POPULATE_WRITE; older kernels reject that (EINVAL) and instead get
+    one byte written per page. Any other error (ENOMEM, EFAULT) means the
+    memory is not there and is raised. Returns the number of pages touched.
+    """
+    num_pages = size_bytes // page_size
+    try:
+        mm.madvise(MADV_POPULATE_WRITE)
+        return num_pages
+    except OSError as e:
+        if e.errno != errno.EINVAL:
+            raise
+    except AttributeError:
+        pass  # mmap.madvise needs Python 3.8+
+    
+    # One strided C-level store per page - no Python loop
+    view = memoryview(mm)
+    view[::page_size] = b'\x42' * num_pages
+    view.release()  # an exported view would block mm.close()
+    return num_pages
+
 
 @app.route('/api/playground/allocate', methods=['POST'])
 def playground_allocate():
@@ -834,37 +1553,63 @@ def playground_allocate():
     data = request.get_json() or {}
     size_mb = data.get('size_mb', 10)
     touch = data.get('touch', True)  # Touch pages to cause real allocation
+    huge = data.get('huge', False)   # Back the region with 2MB pages
     
     size_bytes = size_mb * 1024 * 1024
     
     try:
-        # Create anonymous mmap (real memory allocation)
-        mm = mmap.mmap(-1, size_bytes, mmap.MAP_PRIVATE | mmap.MAP_ANONYMOUS)
+        mm = None
+        advice = 'NORMAL'
+        hugetlb = False
+        page_size = 4096
+        if huge and size_bytes % HUGE_PAGE_SIZE == 0:
+            try:
+                mm = mmap.mmap(-1, size_bytes, mmap.MAP_PRIVATE | mmap.MAP_ANONYMOUS | MAP_HUGETLB)
+                hugetlb = True  # reserved 2MB pages, not THP
+                page_size = HUGE_PAGE_SIZE
+            except OSError:
+                pass  # No hugetlbfs pages reserved - use THP below
         
-        region_id = len(playground_state['allocations'])
+        if mm is None:
+            # Create anonymous mmap (real memory allocation)
+            mm = mmap.mmap(-1, size_bytes, mmap.MAP_PRIVATE | mmap.MAP_ANONYMOUS)
+            if huge:
+                try:
+                    mm.madvise(MADV_HUGEPAGE)
+                    advice = 'HUGEPAGE'
+                except OSError:
+                    huge = False  # THP disabled in this kernel
         
-        # Touch pages if requested (causes actual page faults)
+        # Touch pages if requested (causes actual page faults). Done before
+        # taking an ID so a failed populate doesn't use one up.
         pages_touched = 0
         if touch:
-            page_size = 4096
-            for offset in range(0, size_bytes, page_size):
-                mm[offset] = 0x42  # Write to each page
-                pages_touched += 1
+            pages_touched = playground_populate(mm, size_bytes, page_size)
+        
+        free_ids = playground_state.free_ids
+        if free_ids:
+            region_id = heapq.heappop(free_ids)
+        else:
+            region_id = playground_state.next_id
+            playground_state.next_id += 1
+        address = ctypes.addressof(ctypes.c_char.from_buffer(mm))
         
         region = {
             'id': region_id,
             'size_mb': size_mb,
             'size_bytes': size_bytes,
             'locked': False,
-            'advice': 'NORMAL',
-            'pages': size_bytes // 4096,
+            'advice': advice,
+            'huge': bool(huge),
+            'hugetlb': hugetlb,
+            'pages': size_bytes // page_size,
             'pages_touched': pages_touched,
             'mmap_obj': mm,
-            'address': ctypes.addressof(ctypes.c_char.from_buffer(mm))
+            'address': address
         }
         
-        playground_state['allocations'].append(region)
-        playground_state['total_allocated'] += size_bytes
+        playground_state.allocations[region_id] = region
+        playground_state.total_allocated += size_bytes
         
         return jsonify({
             'success': True,
@@ -887,24 +1632,22 @@ def playground_lock():
     if not MLOCK_AVAILABLE:
         return jsonify({'success': False, 'error': 'mlock not available on this system'})
     
-    if region_id >= len(playground_state['allocations']):
+    region = playground_state.allocations.get(region_id)
+    if region is None:
         return jsonify({'success': False, 'error': 'Invalid region ID'})
     
-    region = playground_state['allocations'][region_id]
-    
     if region['locked']:
         return jsonify({'success': False, 'error': 'Region already locked'})
     
     try:
-        addr = region['address']
         size = region['size_bytes']
         
-        result = libc.mlock(ctypes.c_void_p(addr), ctypes.c_size_t(size))
+        result = libc.mlock(region['address'], size)
         if result != 0:
             return jsonify({'success': False, 'error': f'mlock failed: errno {ctypes.get_errno()}'})
         
         region['locked'] = True
-        playground_state['total_locked'] += size
+        playground_state.total_locked += size
         
         return jsonify({
             'success': True,
@@ -924,24 +1667,22 @@ def playground_unlock():
     if not MLOCK_AVAILABLE:
         return jsonify({'success': False, 'error': 'munlock not available'})
     
-    if region_id >= len(playground_state['allocations']):
+    region = playground_state.allocations.get(region_id)
+    if region is None:
         return jsonify({'success': False, 'error': 'Invalid region ID'})
     
-    region = playground_state['allocations'][region_id]
-    
     if not region['locked']:
         return jsonify({'success': False, 'error': 'Region not locked'})
     
     try:
-        addr = region['address']
         size = region['size_bytes']
         
-        result = libc.munlock(ctypes.c_void_p(addr), ctypes.c_size_t(size))
+        result = libc.munlock(region['address'], size)
         if result != 0:
             return jsonify({'success': False, 'error': f'munlock failed'})
         
         region['locked'] = False
-        playground_state['total_locked'] -= size
+        playground_state.total_locked -= size
         
         return jsonify({
             'success': True,
@@ -959,11 +1700,10 @@ def playground_advise():
     region_id = data.get('region_id', 0)
     advice = data.get('advice', 'NORMAL')
     
-    if region_id >= len(playground_state['allocations']):
+    region = playground_state.allocations.get(region_id)
+    if region is None:
         return jsonify({'success': False, 'error': 'Invalid region ID'})
     
-    region = playground_state['allocations'][region_id]
-    
     # Map advice strings to madvise constants
     advice_map = {
         'NORMAL': 0,      # MADV_NORMAL
@@ -971,6 +1711,8 @@ def playground_advise():
         'SEQUENTIAL': 2,  # MADV_SEQUENTIAL
         'WILLNEED': 3,    # MADV_WILLNEED (prefetch)
         'DONTNEED': 4,    # MADV_DONTNEED (can discard)
+        'HUGEPAGE': 14,   # MADV_HUGEPAGE (use transparent huge pages)
+        'NOHUGEPAGE': 15, # MADV_NOHUGEPAGE (keep 4KB pages)
     }
     
     if advice not in advice_map:
@@ -980,13 +1722,17 @@ def playground_advise():
         mm = region['mmap_obj']
         mm.madvise(advice_map[advice])
         region['advice'] = advice
+        if advice in ('HUGEPAGE', 'NOHUGEPAGE') and not region['hugetlb']:
+            region['huge'] = advice == 'HUGEPAGE'
         
         descriptions = {
             'NORMAL': 'Default access pattern',
             'RANDOM': 'Expect random access (disable readahead)',
             'SEQUENTIAL': 'Expect sequential access (aggressive readahead)',
             'WILLNEED': 'Will need soon (prefetch into memory)',
-            'DONTNEED': 'Won\'t need soon (can be swapped out)'
+            'DONTNEED': 'Won\'t need soon (can be swapped out)',
+            'HUGEPAGE': 'Back with 2MB transparent huge pages',
+            'NOHUGEPAGE': 'Keep regular 4KB pages'
         }
         
         return jsonify({
@@ -1005,25 +1751,21 @@ def playground_free():
     data = request.get_json() or {}
     region_id = data.get('region_id', 0)
     
-    if region_id >= len(playground_state['allocations']):
+    region = playground_state.allocations.get(region_id)
+    if region is None:
         return jsonify({'success': False, 'error': 'Invalid region ID'})
     
-    region = playground_state['allocations'][region_id]
-    
-    if region.get('freed'):
-        return jsonify({'success': False, 'error': 'Region already freed'})
-    
     try:
         # Unlock if locked
         if region['locked'] and MLOCK_AVAILABLE:
-            libc.munlock(ctypes.c_void_p(region['address']), 
-                        ctypes.c_size_t(region['size_bytes']))
-            playground_state['total_locked'] -= region['size_bytes']
+            libc.munlock(region['address'], region['size_bytes'])
+            playground_state.total_locked -= region['size_bytes']
         
         # Close mmap
         region['mmap_obj'].close()
-        region['freed'] = True
-        playground_state['total_allocated'] -= region['size_bytes']
+        del playground_state.allocations[region_id]
+        heapq.heappush(playground_state.free_ids, region_id)
+        playground_state.total_allocated -= region['size_bytes']
         
         return jsonify({
             'success': True,
@@ -1038,21 +1780,23 @@ def playground_free():
 def playground_status():
     """Get current playground status."""
     regions = []
-    for r in playground_state['allocations']:
-        if not r.get('freed'):
-            regions.append({
-                'id': r['id'],
-                'size_mb': r['size_mb'],
-                'pages': r['pages'],
-                'locked': r['locked'],
-                'advice': r['advice']
-            })
+    # By ID: reused IDs would otherwise follow dict insertion order
+    for _, r in sorted(playground_state.allocations.items()):
+        regions.append({
+            'id': r['id'],
+            'size_mb': r['size_mb'],
+            'pages': r['pages'],
+            'locked': r['locked'],
+            'advice': r['advice'],
+            'huge': r['huge'],
+            'hugetlb': r['hugetlb']
+        })
     
     return jsonify({
         'success': True,
         'regions': regions,
-        'total_allocated_mb': playground_state['total_allocated'] / (1024 * 1024),
-        'total_locked_mb': playground_state['total_locked'] / (1024 * 1024),
+        'total_allocated_mb': playground_state.total_allocated / (1024 * 1024),
+        'total_locked_mb': playground_state.total_locked / (1024 * 1024),
         'mlock_available': MLOCK_AVAILABLE
     })
 
@@ -1063,21 +1807,17 @@ def playground_reset():
     freed_count = 0
     freed_mb = 0
     
-    for region in playground_state['allocations']:
-        if not region.get('freed'):
-            try:
-                if region['locked'] and MLOCK_AVAILABLE:
-                    libc.munlock(ctypes.c_void_p(region['address']),
-                                ctypes.c_size_t(region['size_bytes']))
-                region['mmap_obj'].close()
-                freed_count += 1
-                freed_mb += region['size_mb']
-            except:
-                pass
-    
-    playground_state['allocations'] = []
-    playground_state['total_allocated'] = 0
-    playground_state['total_locked'] = 0
+    for region in playground_state.allocations.values():
+        try:
+            if region['locked'] and MLOCK_AVAILABLE:
+                libc.munlock(region['address'], region['size_bytes'])
+            region['mmap_obj'].close()
+            freed_count += 1
+            freed_mb += region['size_mb']
+        except:
+            pass
+    
+    playground_state.reset()
     
     return jsonify({
         'success': True,
@@ -1103,8 +1843,12 @@ if __name__ == '__main__':
     print("  POST /api/tlb/init            - Initialize TLB")
     print("  POST /api/tlb/lookup          - Lookup in TLB")
     print("  POST /api/tlb/access          - TLB access (lookup + insert)")
+    print("  POST /api/tlb/access_batch    - Batch of TLB accesses")
     print("  GET  /api/tlb/status          - TLB status")
     print("  POST /api/tlb/flush           - Flush TLB")
     print()
+    print("Development server - for production use:")
+    print("  gunicorn -k gevent --worker-connections 200 -w 1 -b 0.0.0.0:5000 wsgi:app")
+    print()
     
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    app.run(debug=os.environ.get('FLASK_DEBUG') == '1', host='0.0.0.0', port=5000, threaded=True)
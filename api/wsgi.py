@@ -0,0 +1,17 @@
+"""
+Virtual Memory Visualization Tool - WSGI Entry Point
+
+Production entry point for gunicorn with gevent workers:
+
+    gunicorn -k gevent --worker-connections 200 -w 1 -b 0.0.0.0:5000 wsgi:app
+
+Keep a single worker: the TLB, paging and playground simulators hold their
+state in-process, so requests must all reach the same process. gevent gives
+that worker concurrency while it waits on the vmem_shell backend.
+"""
+
+# Must run before Flask/subprocess are imported so blocking calls yield
+from gevent import monkey
+monkey.patch_all()
+
+from app import app  # noqa: E402
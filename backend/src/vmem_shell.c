@@ -54,7 +54,7 @@ static void print_banner(void) {
     printf("╚══════════════════════════════════════════════════════════════╝\n");
     printf("\n");
     printf("Type 'help' for available commands.\n");
-    printf("Note: Some commands require root privileges.\n");
+    printf("Note: Some commands require root privileges (or make install-caps).\n");
     printf("\n");
 }
 
@@ -652,6 +652,117 @@ static void run_shell(void) {
     }
 }
 
+/* ============================================================================
+ * API Mode (JSON Output)
+ * ============================================================================ */
+
+/**
+ * Run one API command and write its JSON result into buf.
+ * argv[0] is the command name, followed by its arguments.
+ */
+static void run_json_command(int argc, char *argv[], JsonBuffer *buf) {
+    if (strcmp(argv[0], "processes") == 0) {
+        ProcessInfo processes[1000];
+        int count = get_process_list(processes, 1000);
+        if (count >= 0) {
+            /* Sort by memory usage (highest first) */
+            qsort(processes, count, sizeof(ProcessInfo), compare_proc_by_memory);
+            json_process_list(processes, count, buf);
+        } else {
+            json_error("Failed to read process list", buf);
+        }
+        
+    } else if (strcmp(argv[0], "maps") == 0 && argc > 1) {
+        int pid = atoi(argv[1]);
+        MemoryRegion regions[MAX_REGIONS];
+        int count = get_memory_regions(pid, regions, MAX_REGIONS);
+        if (count >= 0) {
+            json_memory_regions(regions, count, buf);
+        } else {
+            json_error("Failed to read memory regions", buf);
+        }
+        
+    } else if (strcmp(argv[0], "translate") == 0 && argc > 2) {
+        int pid = atoi(argv[1]);
+        uint64_t vaddr = parse_address(argv[2]);
+        PageWalkResult result;
+        translate_address(pid, vaddr, &result);
+        json_page_walk(&result, buf);
+        
+    } else if (strcmp(argv[0], "stats") == 0 && argc > 1) {
+        int pid = atoi(argv[1]);
+        MemoryStats stats;
+        if (get_memory_stats(pid, &stats) == 0) {
+            json_memory_stats(&stats, buf);
+        } else {
+            json_error("Failed to read memory stats", buf);
+        }
+        
+    } else if (strcmp(argv[0], "sysinfo") == 0) {
+        SystemMemInfo info;
+        if (get_system_memory_info(&info) == 0) {
+            json_system_memory(&info, buf);
+        } else {
+            json_error("Failed to read system memory info", buf);
+        }
+        
+    } else {
+        json_error("Unknown command", buf);
+    }
+}
+
+/**
+ * Persistent API daemon: read one command per line from stdin and answer
+ * each with a 4-byte big-endian payload length followed by the JSON payload.
+ * Exits when stdin is closed.
+ */
+static void run_daemon(void) {
+    char input[512];
+    char *args[8];
+    
+    while (fgets(input, sizeof(input), stdin) != NULL) {
+        /* An overlong line must still get exactly one reply frame */
+        int too_long = strchr(input, '\n') == NULL && !feof(stdin);
+        if (too_long) {
+            int c;
+            while ((c = getchar()) != EOF && c != '\n')
+                ;
+        }
+        
+        int argc = 0;
+        char *tok = strtok(input, " \t\r\n");
+        while (tok != NULL && argc < 8) {
+            args[argc++] = tok;
+            tok = strtok(NULL, " \t\r\n");
+        }
+        
+        JsonBuffer *buf = json_buffer_init(0);
+        if (buf == NULL) {
+            break;
+        }
+        
+        if (too_long) {
+            json_error("Command too long", buf);
+        } else if (argc > 0) {
+            run_json_command(argc, args, buf);
+        } else {
+            json_error("Empty command", buf);
+        }
+        
+        /* Length-prefixed frame so the reader never has to scan for a delimiter */
+        uint32_t len = (uint32_t)buf->size;
+        unsigned char header[4] = {
+            (unsigned char)(len >> 24), (unsigned char)(len >> 16),
+            (unsigned char)(len >> 8), (unsigned char)len
+        };
+        fwrite(header, 1, sizeof(header), stdout);
+        fwrite(json_buffer_str(buf), 1, len, stdout);
+        fflush(stdout);
+        
+        json_buffer_free(buf);
+    }
+}
+
 /* ============================================================================
  * Main Entry Point
  * ============================================================================ */
@@ -663,64 +774,25 @@ int main(int argc, char *argv[]) {
         if (strcmp(argv[1], "--json") == 0 && argc > 2) {
             JsonBuffer *buf = json_buffer_init(0);
             
-            if (strcmp(argv[2], "processes") == 0) {
-                ProcessInfo processes[1000];
-                int count = get_process_list(processes, 1000);
-                if (count >= 0) {
-                    /* Sort by memory usage (highest first) */
-                    qsort(processes, count, sizeof(ProcessInfo), compare_proc_by_memory);
-                    json_process_list(processes, count, buf);
-                } else {
-                    json_error("Failed to read process list", buf);
-                }
-                
-            } else if (strcmp(argv[2], "maps") == 0 && argc > 3) {
-                int pid = atoi(argv[3]);
-                MemoryRegion regions[MAX_REGIONS];
-                int count = get_memory_regions(pid, regions, MAX_REGIONS);
-                if (count >= 0) {
-                    json_memory_regions(regions, count, buf);
-                } else {
-                    json_error("Failed to read memory regions", buf);
-                }
-                
-            } else if (strcmp(argv[2], "translate") == 0 && argc > 4) {
-                int pid = atoi(argv[3]);
-                uint64_t vaddr = parse_address(argv[4]);
-                PageWalkResult result;
-                translate_address(pid, vaddr, &result);
-                json_page_walk(&result, buf);
-                
-            } else if (strcmp(argv[2], "stats") == 0 && argc > 3) {
-                int pid = atoi(argv[3]);
-                MemoryStats stats;
-                if (get_memory_stats(pid, &stats) == 0) {
-                    json_memory_stats(&stats, buf);
-                } else {
-                    json_error("Failed to read memory stats", buf);
-                }
-                
-            } else if (strcmp(argv[2], "sysinfo") == 0) {
-                SystemMemInfo info;
-                if (get_system_memory_info(&info) == 0) {
-                    json_system_memory(&info, buf);
-                } else {
-                    json_error("Failed to read system memory info", buf);
-                }
-                
-            } else {
-                json_error("Unknown command", buf);
-            }
+            run_json_command(argc - 2, argv + 2, buf);
             
             json_buffer_print(buf);
             json_buffer_free(buf);
             return 0;
         }
         
+        /* Persistent API mode: commands on stdin, framed JSON on stdout */
+        if (strcmp(argv[1], "--daemon") == 0) {
+            run_daemon();
+            return 0;
+        }
+        
         /* Show help */
-        printf("Usage: %s [--json <command> [args...]]\n", argv[0]);
+        printf("Usage: %s [--json <command> [args...] | --daemon]\n", argv[0]);
         printf("\nInteractive mode: Run without arguments\n");
         printf("API mode: --json <command> [args...]\n");
+        printf("Daemon mode: --daemon (one command per line on stdin,\n");
+        printf("             4-byte big-endian length + JSON per reply)\n");
         printf("\nAPI commands:\n");
         printf("  processes              List all processes\n");
         printf("  maps <pid>             Get memory regions for PID\n");
@@ -26,6 +26,7 @@ function MemoryPlayground() {
   const [status, setStatus] = useState(null)
   const [systemMem, setSystemMem] = useState(null)
   const [allocSize, setAllocSize] = useState(10)
+  const [useHuge, setUseHuge] = useState(false)
   const [loading, setLoading] = useState(false)
   const [message, setMessage] = useState(null)
   const [selectedRegion, setSelectedRegion] = useState(null)
@@ -35,7 +36,9 @@ function MemoryPlayground() {
     { value: 'SEQUENTIAL', label: 'Sequential', desc: 'Expect sequential reads' },
     { value: 'RANDOM', label: 'Random', desc: 'Expect random access' },
     { value: 'WILLNEED', label: 'Will Need', desc: 'Prefetch into memory' },
-    { value: 'DONTNEED', label: 'Don\'t Need', desc: 'Can be swapped out' }
+    { value: 'DONTNEED', label: 'Don\'t Need', desc: 'Can be swapped out' },
+    { value: 'HUGEPAGE', label: 'Huge Pages', desc: 'Back with 2MB pages' },
+    { value: 'NOHUGEPAGE', label: 'No Huge Pages', desc: 'Keep 4KB pages' }
   ]
 
   useEffect(() => {
@@ -61,7 +64,7 @@ function MemoryPlayground() {
 
   async function handleAllocate() {
     setLoading(true)
-    const result = await playgroundAllocate(allocSize, true)
+    const result = await playgroundAllocate(allocSize, true, useHuge)
     if (result.success) {
       showMessage(`✓ Allocated ${allocSize}MB (${result.data?.pages_touched || allocSize * 256} pages touched)`, 'success')
       await loadStatus()
@@ -247,6 +250,18 @@ function MemoryPlayground() {
               </div>
             </div>
 
+            <label
+              style={{ display: 'flex', alignItems: 'center', gap: 'var(--spacing-sm)', marginBottom: 'var(--spacing-lg)', fontSize: '0.9rem' }}
+              title="MAP_HUGETLB when 2MB pages are reserved (even sizes only), else MADV_HUGEPAGE"
+            >
+              <input
+                type="checkbox"
+                checked={useHuge}
+                onChange={(e) => setUseHuge(e.target.checked)}
+              />
+              Use 2MB huge pages
+            </label>
+
             <button
               className="btn btn-primary"
               onClick={handleAllocate}
@@ -418,7 +433,7 @@ function MemoryPlayground() {
                             )}
                           </div>
                           <div style={{ fontSize: '0.85rem', color: 'var(--text-muted)' }}>
-                            {region.size_mb} MB • {region.pages} pages • {region.advice}
+                            {region.size_mb} MB • {region.pages} {region.hugetlb ? '2MB ' : ''}pages • {region.advice}{region.huge && (region.hugetlb ? ' • hugetlb' : ' • huge pages')}
                           </div>
                         </div>
                       </div>
@@ -266,17 +266,17 @@ function TLBSimulator() {
                       key={index}
                       initial={false}
                       animate={{
-                        backgroundColor: lastAccess && entry.vpn === lastAccess.vpn 
+                        backgroundColor: lastAccess && entry.valid && `0x${entry.vpn.toString(16)}` === lastAccess.vpn 
                           ? 'rgba(59, 130, 246, 0.15)' 
                           : 'var(--bg-card)'
                       }}
                     >
                       <td>{entry.index}</td>
                       <td style={{ color: entry.valid ? 'var(--accent-cyan)' : 'var(--text-muted)' }}>
-                        {entry.valid ? entry.vpn : '-'}
+                        {entry.valid ? `0x${entry.vpn.toString(16)}` : '-'}
                       </td>
                       <td style={{ color: entry.valid ? 'var(--accent-green)' : 'var(--text-muted)' }}>
-                        {entry.valid ? entry.pfn : '-'}
+                        {entry.valid ? `0x${entry.pfn.toString(16)}` : '-'}
                       </td>
                       <td className={entry.valid ? 'valid' : 'invalid'}>
                         {entry.valid ? '✓' : '✗'}
@@ -93,6 +93,13 @@ export async function tlbAccess(vpn, pfn = null) {
   })
 }
 
+export async function tlbAccessBatch(accesses) {
+  return fetchAPI('/tlb/access_batch', {
+    method: 'POST',
+    body: JSON.stringify({ accesses })
+  })
+}
+
 export async function getTLBStatus() {
   return fetchAPI('/tlb/status')
 }
@@ -146,10 +153,10 @@ export async function resetAll() {
 // Memory Playground API
 // =============================================================================
 
-export async function playgroundAllocate(size_mb, touch = true) {
+export async function playgroundAllocate(size_mb, touch = true, huge = false) {
   return fetchAPI('/playground/allocate', {
     method: 'POST',
-    body: JSON.stringify({ size_mb, touch })
+    body: JSON.stringify({ size_mb, touch, huge })
   })
 }
 